@@ -11,28 +11,27 @@ class SuperuserRequiredMiddleware:
 
     def __init__(self, get_response):
         self.get_response = get_response
+        self.exempt_prefixes = (
+            "/static/",
+            "/__reload__/",
+            "/favicon.ico",
+            "/admin/login",
+            "/admin/js",
+        )
+        self.login_url = reverse("login")
         self.exempt_paths = {
-            reverse("login"),
+            self.login_url,
             reverse("logout"),
         }
 
     def __call__(self, request):
         path = request.path
 
-        if (
-            path.startswith("/static/")
-            or path.startswith("/__reload__/")
-            or path.startswith("/favicon.ico")
-            or path.startswith("/admin/login")
-            or path.startswith("/admin/js")
-        ):
-            return self.get_response(request)
-
-        if path in self.exempt_paths:
+        if path.startswith(self.exempt_prefixes) or path in self.exempt_paths:
             return self.get_response(request)
 
         if not request.user.is_authenticated:
-            return redirect(f"{reverse('login')}?next={path}")
+            return redirect(f"{self.login_url}?next={path}")
 
         if not request.user.is_superuser:
             return HttpResponseForbidden("Superuser required.")
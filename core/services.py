@@ -1,23 +1,83 @@
+import atexit
 import os
+import threading
+import time
+from smtplib import SMTPServerDisconnected
+
 from django.conf import settings
 from django.core.mail import EmailMessage, get_connection
 
+# Resend drops idle SMTP sessions; close ours before that rather than probing
+# a connection that is likely already gone.
+SHARED_CONNECTION_IDLE_SECONDS = 60
+
+_local = threading.local()
 
-def send_email(to_address, subject, body):
-    from django.core.mail import send_mail
-    from django.conf import settings
 
-    with get_connection(
+def _open_connection():
+    return get_connection(
         host=settings.RESEND_SMTP_HOST,
         port=settings.RESEND_SMTP_PORT,
         username=settings.RESEND_SMTP_USERNAME,
         password=os.environ["RESEND_API_KEY"],
         use_tls=True,
-    ) as connection:
-        r = EmailMessage(
-            subject=subject,
-            body=body,
-            to=[to_address],
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            connection=connection,
-        ).send()
+    )
+
+
+def get_shared_connection():
+    """
+    Return an open SMTP connection cached for the current thread.
+    The connection is reopened if it sat idle too long or the server dropped
+    it since the last send.
+    """
+    connection = getattr(_local, "connection", None)
+    if connection is None:
+        connection = _open_connection()
+        _local.connection = connection
+
+    # Only the SMTP backend holds a socket to probe; locmem and console don't.
+    session = getattr(connection, "connection", None)
+    idle = time.monotonic() - getattr(_local, "last_used", 0)
+    if session is not None:
+        if idle > SHARED_CONNECTION_IDLE_SECONDS:
+            connection.close()
+        else:
+            try:
+                session.noop()
+            except SMTPServerDisconnected:
+                connection.close()
+    connection.open()
+    _local.last_used = time.monotonic()
+    return connection
+
+
+@atexit.register
+def close_shared_connection():
+    """
+    Close the current thread's shared SMTP connection, if one is open.
+    """
+    connection = getattr(_local, "connection", None)
+    if connection is not None:
+        connection.close()
+        _local.connection = None
+
+
+def build_email(to_address, subject, body):
+    return EmailMessage(
+        subject=subject,
+        body=body,
+        to=[to_address],
+        from_email=settings.DEFAULT_FROM_EMAIL,
+    )
+
+
+def send_email(to_address, subject, body, connection=None):
+    return send_emails([build_email(to_address, subject, body)], connection)
+
+
+def send_emails(messages, connection=None):
+    """
+    Send a batch of EmailMessages over a single SMTP session.
+    """
+    smtp = connection or get_shared_connection()
+    return smtp.send_messages(messages)
@@ -1,3 +1,46 @@
+import os
+from unittest import mock
+
+from django.core import mail
 from django.test import TestCase
 
-# Create your tests here.
+from core import services
+from core.services import build_email, close_shared_connection, send_email, send_emails
+
+
+@mock.patch.dict(os.environ, {"RESEND_API_KEY": "test-key"})
+class SendEmailTests(TestCase):
+    def tearDown(self):
+        close_shared_connection()
+
+    def test_send_email_delivers_one_message(self):
+        sent = send_email("someone@example.com", "Hello", "Body")
+
+        self.assertEqual(sent, 1)
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ["someone@example.com"])
+        self.assertEqual(mail.outbox[0].subject, "Hello")
+
+    def test_send_emails_delivers_batch(self):
+        messages = [
+            build_email(f"person{i}@example.com", f"Subject {i}", "Body")
+            for i in range(3)
+        ]
+
+        sent = send_emails(messages)
+
+        self.assertEqual(sent, 3)
+        self.assertEqual(
+            [message.to for message in mail.outbox],
+            [[f"person{i}@example.com"] for i in range(3)],
+        )
+
+    def test_repeated_sends_reuse_shared_connection(self):
+        with mock.patch.object(
+            services, "_open_connection", wraps=services._open_connection
+        ) as open_connection:
+            send_email("a@example.com", "One", "Body")
+            send_email("b@example.com", "Two", "Body")
+
+        self.assertEqual(open_connection.call_count, 1)
+        self.assertEqual(len(mail.outbox), 2)
@@ -1,4 +1,6 @@
 from django.contrib import admin
+from django.contrib.postgres.search import SearchQuery
+from django.db import connection
 
 from social.models import (
     Contact,
@@ -8,6 +10,35 @@ from social.models import (
 )
 
 
+class FullTextSearchMixin:
+    """
+    On Postgres, match `full_text_fields` through the model's trigger-maintained
+    `search` vector instead of ILIKE-scanning them. Other search fields behave
+    as usual. The query is parsed with the same `english` configuration the
+    trigger builds the vectors with.
+    """
+
+    full_text_fields = ()
+
+    def get_search_fields(self, request):
+        search_fields = super().get_search_fields(request)
+        if connection.vendor != "postgresql":
+            return search_fields
+        return tuple(f for f in search_fields if f not in self.full_text_fields)
+
+    def get_search_results(self, request, queryset, search_term):
+        results, may_have_duplicates = super().get_search_results(
+            request, queryset, search_term
+        )
+        if search_term and connection.vendor == "postgresql":
+            results |= queryset.filter(
+                search=SearchQuery(
+                    search_term, config="english", search_type="websearch"
+                )
+            )
+        return results, may_have_duplicates
+
+
 class ContactTouchpointInline(admin.TabularInline):
     model = ContactTouchpoint
     extra = 0
@@ -17,7 +48,7 @@ class ContactTouchpointInline(admin.TabularInline):
 
 
 @admin.register(Contact)
-class ContactAdmin(admin.ModelAdmin):
+class ContactAdmin(FullTextSearchMixin, admin.ModelAdmin):
     list_display = (
         "name",
         "relationship_to_me",
@@ -27,22 +58,26 @@ class ContactAdmin(admin.ModelAdmin):
     )
     list_filter = ("relationship_to_me", "priority", "preferred_channel")
     search_fields = ("name", "notes")
+    full_text_fields = ("notes",)
     prepopulated_fields = {"slug": ("name",)}
     inlines = [ContactTouchpointInline]
 
 
 @admin.register(ContactTouchpoint)
-class ContactTouchpointAdmin(admin.ModelAdmin):
+class ContactTouchpointAdmin(FullTextSearchMixin, admin.ModelAdmin):
     list_display = ("contact", "date", "channel", "sentiment")
+    list_select_related = ("contact",)
     list_filter = ("channel", "sentiment")
     date_hierarchy = "date"
     search_fields = ("contact__name", "notes")
+    full_text_fields = ("notes",)
     autocomplete_fields = ("contact",)
 
 
 @admin.register(ContactRelationship)
 class ContactRelationshipAdmin(admin.ModelAdmin):
     list_display = ("from_contact", "to_contact", "relationship_type", "updated_at")
+    list_select_related = ("from_contact", "to_contact")
     list_filter = ("relationship_type",)
     search_fields = ("from_contact__name", "to_contact__name")
     autocomplete_fields = ("from_contact", "to_contact")
@@ -1,7 +1,7 @@
 from django import forms
 from django.utils import timezone
 
-from social.models import ContactTouchpoint
+from social.models import Contact, ContactTouchpoint
 
 
 class ContactTouchpointForm(forms.ModelForm):
@@ -19,6 +19,9 @@ class ContactTouchpointForm(forms.ModelForm):
         initial = kwargs.setdefault("initial", {})
         initial.setdefault("date", timezone.localdate())
         super().__init__(*args, **kwargs)
+        self.fields["contact"].queryset = Contact.objects.only("slug", "name").order_by(
+            "name"
+        )
         self.fields["channel"].widget.attrs["class"] = "form-select"
         self.fields["sentiment"].widget.attrs["class"] = "form-select"
         self.fields["contact"].widget.attrs["class"] = "form-select"
@@ -0,0 +1,21 @@
+# Generated by Django 6.0 on 2026-10-15 21:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('social', '0004_contacttouchpoint_sentiment'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contacttouchpoint',
+            index=models.Index(fields=['contact', '-date', '-created_at'], name='social_cont_contact_51d75d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contacttouchpoint',
+            index=models.Index(fields=['date'], name='social_cont_date_34307c_idx'),
+        ),
+    ]
@@ -0,0 +1,39 @@
+from django.db import migrations
+
+# Admin search runs ILIKE '%q%' against these columns. Trigram GIN indexes let
+# Postgres answer those lookups without a sequential scan. SQLite (used in
+# development) has no equivalent, so the operations are skipped there.
+# `notes` searches go through the full-text `search` vectors (0007) instead.
+TRIGRAM_INDEXES = [
+    ("social_contact_name_trgm", "social_contact", "name"),
+    ("social_interest_name_trgm", "social_interest", "name"),
+    ("social_interest_description_trgm", "social_interest", "description"),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {name} ON {table} USING gin ({column} gin_trgm_ops)"
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name, _, _ in TRIGRAM_INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('social', '0005_contacttouchpoint_social_cont_contact_51d75d_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
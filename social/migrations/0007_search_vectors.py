@@ -0,0 +1,59 @@
+# Generated by Django 6.0 on 2026-10-15 21:54
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+# (table, source columns) for each search vector. A BEFORE INSERT/UPDATE
+# trigger keeps the column current and a GIN index serves the @@ lookups.
+# Postgres-only; on SQLite the columns are added but stay empty.
+SEARCH_VECTORS = [
+    ("social_contact", ("name", "notes")),
+    ("social_contacttouchpoint", ("notes",)),
+]
+
+
+def create_search_triggers(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for table, columns in SEARCH_VECTORS:
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {table}_search_gin ON {table} USING gin (search)"
+        )
+        schema_editor.execute(
+            f"CREATE TRIGGER {table}_search_update BEFORE INSERT OR UPDATE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION tsvector_update_trigger("
+            f"search, 'pg_catalog.english', {', '.join(columns)})"
+        )
+        document = " || ' ' || ".join(f"coalesce({column}, '')" for column in columns)
+        schema_editor.execute(
+            f"UPDATE {table} SET search = to_tsvector('pg_catalog.english', {document})"
+        )
+
+
+def drop_search_triggers(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for table, _ in SEARCH_VECTORS:
+        schema_editor.execute(f"DROP TRIGGER IF EXISTS {table}_search_update ON {table}")
+        schema_editor.execute(f"DROP INDEX IF EXISTS {table}_search_gin")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('social', '0006_trigram_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contact',
+            name='search',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='contacttouchpoint',
+            name='search',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(create_search_triggers, drop_search_triggers),
+    ]
@@ -1,3 +1,4 @@
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from core.models import TimestampedModel
 from django.core.validators import MaxValueValidator
@@ -43,6 +44,8 @@ class Contact(TimestampedModel):
     )
     check_in_frequency_days = models.PositiveIntegerField(default=30)
     last_contacted_at = models.DateField(null=True, blank=True)
+    # Maintained by a Postgres trigger from name and notes.
+    search = SearchVectorField(null=True, editable=False)
 
 
 class ContactRelationship(TimestampedModel):
@@ -73,6 +76,14 @@ class ContactTouchpoint(TimestampedModel):
         max_length=100, blank=True, choices=ContactTouchpointSentiment.choices
     )
     notes = models.TextField(blank=True)
+    # Maintained by a Postgres trigger from notes.
+    search = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["contact", "-date", "-created_at"]),
+            models.Index(fields=["date"]),
+        ]
 
     def __str__(self):
         return f"Touchpoint with {self.contact.name} on {self.date}"
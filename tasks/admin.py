@@ -5,7 +5,7 @@ from .models import Comment, Project, Routine, RoutineStep, Tag, Task
 
 @admin.register(Tag)
 class TagAdmin(admin.ModelAdmin):
-    list_display = ("name", "color", "created_at", "updated_at")
+    list_display = ("name", "color", "task_count", "created_at", "updated_at")
     search_fields = ("name",)
 
 
@@ -31,6 +31,13 @@ class TaskAdmin(admin.ModelAdmin):
     inlines = (CommentInline,)
     ordering = ("status", "-priority", "due_at", "order", "-created_at")
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_status_flags()
+
+    @admin.display(boolean=True, ordering="_is_active")
+    def is_active(self, obj):
+        return obj.is_active
+
 
 @admin.register(Project)
 class ProjectAdmin(admin.ModelAdmin):
@@ -0,0 +1,35 @@
+# Generated by Django 6.0 on 2026-10-15 21:56
+
+from django.db import migrations, models
+
+
+def backfill_status_counters(apps, schema_editor):
+    Task = apps.get_model("tasks", "Task")
+    StatusCounter = apps.get_model("tasks", "StatusCounter")
+    rows = (
+        Task.objects.order_by()
+        .values("status")
+        .annotate(max_order=models.Max("order"))
+    )
+    StatusCounter.objects.bulk_create(
+        StatusCounter(status=row["status"], next_order=row["max_order"] or 0)
+        for row in rows
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0008_alter_tag_color'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StatusCounter',
+            fields=[
+                ('status', models.CharField(choices=[('todo', 'To do'), ('in_progress', 'In progress'), ('blocked', 'Blocked'), ('cancelled', 'Cancelled'), ('done', 'Done')], help_text='Workflow state the counter belongs to.', max_length=20, primary_key=True, serialize=False)),
+                ('next_order', models.PositiveIntegerField(default=0, help_text='Highest order handed out within the status.')),
+            ],
+        ),
+        migrations.RunPython(backfill_status_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 6.0 on 2026-10-15 22:00
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def backfill_task_counts(apps, schema_editor):
+    Tag = apps.get_model("tasks", "Tag")
+    TaskTag = apps.get_model("tasks", "Task").tags.through
+    counts = (
+        TaskTag.objects.filter(tag=models.OuterRef("pk"))
+        .order_by()
+        .values("tag")
+        .annotate(count=models.Count("pk"))
+        .values("count")
+    )
+    Tag.objects.update(task_count=Coalesce(models.Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0010_remove_task_tasks_task_status_4a0a95_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tag',
+            name='task_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Number of tasks with this label.'),
+        ),
+        migrations.RunPython(backfill_task_counts, migrations.RunPython.noop),
+    ]
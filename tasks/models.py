@@ -1,8 +1,24 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from core.models import TimestampedModel
 
 
+class TagQuerySet(models.QuerySet):
+    def refresh_task_counts(self):
+        """
+        Recompute the denormalized `task_count` for the tags in this queryset.
+        """
+        counts = (
+            self.model.tasks.through.objects.filter(tag=models.OuterRef("pk"))
+            .order_by()
+            .values("tag")
+            .annotate(count=models.Count("pk"))
+            .values("count")
+        )
+        return self.update(task_count=Coalesce(models.Subquery(counts), 0))
+
+
 class Tag(TimestampedModel):
     name = models.CharField(
         max_length=50,
@@ -13,6 +29,13 @@ class Tag(TimestampedModel):
         blank=True,
         help_text="Optional CSS color name for UI accents.",
     )
+    task_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Number of tasks with this label.",
+    )
+
+    objects = TagQuerySet.as_manager()
 
     class Meta:
         ordering = ["name"]
@@ -52,6 +75,48 @@ class Project(TimestampedModel):
         return self.name
 
 
+class TaskQuerySet(models.QuerySet):
+    def with_status_flags(self, today=None):
+        """
+        Annotate `_is_active` and `_is_overdue` so the matching properties are
+        computed by the database and can be filtered or sorted on.
+        """
+        today = today or timezone.localdate()
+        return self.annotate(
+            _is_active=models.ExpressionWrapper(
+                ~models.Q(status__in=[Task.Status.DONE, Task.Status.CANCELLED]),
+                output_field=models.BooleanField(),
+            ),
+            _is_overdue=models.ExpressionWrapper(
+                ~models.Q(status=Task.Status.DONE)
+                & models.Q(due_at__isnull=False, due_at__lt=today),
+                output_field=models.BooleanField(),
+            ),
+        )
+
+    def mark_done(self):
+        """
+        Complete every task in this queryset with a single UPDATE. Tasks that
+        were already done keep their original `completed_at`.
+        """
+        now = timezone.now()
+        return self.update(
+            status=Task.Status.DONE,
+            completed_at=Coalesce("completed_at", models.Value(now)),
+            updated_at=now,
+        )
+
+    def cancel(self):
+        """
+        Cancel every task in this queryset with a single UPDATE.
+        """
+        return self.update(
+            status=Task.Status.CANCELLED,
+            completed_at=None,
+            updated_at=timezone.now(),
+        )
+
+
 class Task(TimestampedModel):
     class Status(models.TextChoices):
         TODO = "todo", "To do"
@@ -169,11 +234,19 @@ class Task(TimestampedModel):
         help_text="True if explicitly kept from the routine.",
     )  # if you explicitly "keep" it
 
+    objects = TaskQuerySet.as_manager()
+
     class Meta:
         ordering = ["status", "-priority", "due_at", "order", "-created_at"]
         indexes = [
-            models.Index(fields=["status"]),
+            models.Index(fields=["status", "order", "-priority"]),
+            models.Index(
+                fields=["completed_at"],
+                condition=models.Q(status="done"),
+                name="tasks_task_done_completed_idx",
+            ),
             models.Index(fields=["due_at"]),
+            models.Index(fields=["created_at", "id"]),
         ]
 
     def __str__(self) -> str:
@@ -214,17 +287,49 @@ class Task(TimestampedModel):
 
     @property
     def is_active(self) -> bool:
+        if hasattr(self, "_is_active"):
+            return self._is_active
         return self.status not in {Task.Status.DONE, Task.Status.CANCELLED}
 
     @property
     def is_overdue(self) -> bool:
+        if hasattr(self, "_is_overdue"):
+            return self._is_overdue
         return (
             self.status != Task.Status.DONE
             and self.due_at is not None
-            and self.due_at < timezone.now()
+            and self.due_at < timezone.localdate()
         )
 
 
+class StatusCounter(models.Model):
+    status = models.CharField(
+        max_length=20,
+        primary_key=True,
+        choices=Task.Status.choices,
+        help_text="Workflow state the counter belongs to.",
+    )
+    next_order = models.PositiveIntegerField(
+        default=0,
+        help_text="Highest order handed out within the status.",
+    )
+
+    def __str__(self) -> str:
+        return f"{self.status}: {self.next_order}"
+
+    @classmethod
+    def next_order_for(cls, status) -> int:
+        """
+        Reserve the next `order` value for a task entering `status`.
+        """
+        counters = cls.objects.filter(status=status)
+        with transaction.atomic():
+            if not counters.update(next_order=models.F("next_order") + 1):
+                cls.objects.get_or_create(status=status)
+                counters.update(next_order=models.F("next_order") + 1)
+            return counters.values_list("next_order", flat=True).get()
+
+
 class Comment(TimestampedModel):
     task = models.ForeignKey(
         Task,
@@ -0,0 +1,36 @@
+from django.db.models.signals import m2m_changed, post_delete, pre_delete
+from django.dispatch import receiver
+
+from tasks.models import Tag, Task
+
+
+@receiver(m2m_changed, sender=Task.tags.through)
+def refresh_tag_counts_on_tag_change(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    if action == "pre_clear":
+        # The rows are gone by post_clear, so note which tags were affected.
+        instance._cleared_tag_ids = (
+            [instance.pk]
+            if reverse
+            else list(instance.tags.values_list("pk", flat=True))
+        )
+        return
+    if action == "post_clear":
+        tag_ids = getattr(instance, "_cleared_tag_ids", [])
+    elif action in ("post_add", "post_remove"):
+        tag_ids = [instance.pk] if reverse else pk_set
+    else:
+        return
+    Tag.objects.filter(pk__in=tag_ids).refresh_task_counts()
+
+
+@receiver(pre_delete, sender=Task)
+def remember_tags_before_task_delete(sender, instance, **kwargs):
+    # Deleting a task cascades to its tag rows without sending m2m_changed.
+    instance._deleted_tag_ids = list(instance.tags.values_list("pk", flat=True))
+
+
+@receiver(post_delete, sender=Task)
+def refresh_tag_counts_on_task_delete(sender, instance, **kwargs):
+    Tag.objects.filter(pk__in=instance._deleted_tag_ids).refresh_task_counts()
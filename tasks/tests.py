@@ -1,3 +1,229 @@
-from django.test import TestCase
+import datetime
+import html
+import re
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core import signing
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from tasks.models import StatusCounter, Task
+from tasks.views import (
+    BOARD_COLUMN_LIMIT,
+    SORT_ORDERINGS,
+    TASK_LIST_CURSOR_SALT,
+    TASK_LIST_PAGE_SIZE,
+)
+
+COLUMN_TAG = re.compile(r"<div class=\"kanban-column[^>]*>")
+CARD_TAG = re.compile(r"<div class=\"card[^\"]*kanban-card[^>]*>")
+ROW_LINK = re.compile(r'href="/tasks/task/(\d+)/edit/"')
+PAGE_LINK = r'href="\?([^"]*\b{}=[^"]*)"'
+
+
+def _column_chunks(html):
+    # Split a board response into {status: markup of that column}.
+    starts = [(m.start(), m.group(0)) for m in COLUMN_TAG.finditer(html)]
+    chunks = {}
+    for i, (start, tag) in enumerate(starts):
+        end = starts[i + 1][0] if i + 1 < len(starts) else len(html)
+        status = re.search(r'data-status="([^"]+)"', tag).group(1)
+        chunks[status] = (tag, html[start:end])
+    return chunks
+
+
+# Full pages link static assets; the manifest only exists after collectstatic.
+@override_settings(
+    STORAGES={
+        "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+        "staticfiles": {
+            "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"
+        },
+    }
+)
+class TaskViewTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_superuser("tester", "tester@example.com", "pw")
+        self.client.force_login(self.user)
+
+
+class MoveTaskTests(TaskViewTestCase):
+    def setUp(self):
+        super().setUp()
+        self.todo = Task.objects.create(title="Write", status=Task.Status.TODO)
+        self.other = Task.objects.create(title="Read", status=Task.Status.TODO)
+        self.doing = Task.objects.create(title="Cook", status=Task.Status.IN_PROGRESS)
+
+    def move(self, task, status, **extra):
+        return self.client.post(
+            reverse("task_move"), {"task_id": task.pk, "status": status, **extra}
+        )
+
+    def test_move_swaps_only_source_and_target_columns(self):
+        response = self.move(self.todo, Task.Status.IN_PROGRESS, from_status="todo")
+
+        self.assertEqual(response.status_code, 200)
+        html = response.content.decode()
+        columns = _column_chunks(html)
+        self.assertEqual(set(columns), {"todo", "in_progress"})
+        self.assertNotIn("kanban-board", html)
+        for status, (tag, _) in columns.items():
+            self.assertIn(f'id="board-column-{status}"', tag)
+            self.assertIn('hx-swap-oob="true"', tag)
+            self.assertIn("data-column", tag)
+
+        self.assertIn(f'data-task-id="{self.todo.pk}"', columns["in_progress"][1])
+        self.assertNotIn(f'data-task-id="{self.todo.pk}"', columns["todo"][1])
+
+    def test_swapped_columns_keep_cards_draggable(self):
+        response = self.move(self.todo, Task.Status.IN_PROGRESS, from_status="todo")
+
+        cards = CARD_TAG.findall(response.content.decode())
+        self.assertEqual(len(cards), 3)
+        for card in cards:
+            self.assertIn('draggable="true"', card)
+            self.assertIn("data-card", card)
+
+    def test_move_without_source_swaps_whole_board(self):
+        response = self.move(self.todo, Task.Status.DONE)
+
+        html = response.content.decode()
+        self.assertIn('hx-swap-oob="outerHTML:#kanban-board"', html)
+        self.assertNotIn('hx-swap-oob="true"', html)
+        self.assertIn("data-dropped", html)
+
+
+class BoardColumnLimitTests(TaskViewTestCase):
+    def setUp(self):
+        super().setUp()
+        self.backlog = [
+            Task.objects.create(
+                title=f"Backlog {i}",
+                status=Task.Status.TODO,
+                order=StatusCounter.next_order_for(Task.Status.TODO),
+            )
+            for i in range(BOARD_COLUMN_LIMIT + 5)
+        ]
+
+    def board_columns(self):
+        html = self.client.get(reverse("task_board")).content.decode()
+        return _column_chunks(html)
+
+    def test_full_column_keeps_most_recent_cards_and_reports_total(self):
+        _, todo = self.board_columns()["todo"]
+
+        self.assertEqual(todo.count("data-card"), BOARD_COLUMN_LIMIT)
+        self.assertIn(f'data-task-id="{self.backlog[-1].pk}"', todo)
+        self.assertNotIn(f'data-task-id="{self.backlog[0].pk}"', todo)
+        self.assertIn(
+            f'<span class="badge bg-secondary">{len(self.backlog)}</span>', todo
+        )
+        self.assertIn("5 older in the task list", todo)
+
+    def test_created_task_shows_on_full_column(self):
+        response = self.client.post(
+            reverse("task_add"),
+            {
+                "title": "Fresh",
+                "status": Task.Status.TODO,
+                "priority": Task.Priority.NORMAL,
+                "energy": Task.Energy.MEDIUM,
+            },
+        )
+        self.assertEqual(response.status_code, 201)
+        created = Task.objects.get(title="Fresh")
+
+        _, todo = self.board_columns()["todo"]
+        self.assertIn(f'data-task-id="{created.pk}"', todo)
+
+    def test_dropped_task_shows_on_full_column(self):
+        dropped = Task.objects.create(title="Dropped", status=Task.Status.BLOCKED)
+
+        response = self.client.post(
+            reverse("task_move"),
+            {"task_id": dropped.pk, "status": "todo", "from_status": "blocked"},
+        )
+
+        _, todo = _column_chunks(response.content.decode())["todo"]
+        self.assertIn(f'data-task-id="{dropped.pk}"', todo)
+        self.assertIn("data-dropped", todo)
+
+
+class TaskListPaginationTests(TaskViewTestCase):
+    def setUp(self):
+        super().setUp()
+        # Enough rows for three pages, with repeated and null sort values.
+        for i in range(TASK_LIST_PAGE_SIZE * 2 + 5):
+            Task.objects.create(
+                title=f"Task {i % 4}",
+                priority=i % 3,
+                due_at=None if i % 2 else datetime.date(2026, 1, 1 + i % 5),
+            )
+
+    def get_page(self, query=""):
+        response = self.client.get(reverse("task_list") + query)
+        self.assertEqual(response.status_code, 200)
+        return response.content.decode()
+
+    def rows(self, body):
+        return [int(pk) for pk in ROW_LINK.findall(body)]
+
+    def link(self, body, param):
+        match = re.search(PAGE_LINK.format(param), body)
+        return "?" + html.unescape(match.group(1)) if match else None
+
+    def assert_pages_cover(self, sort, direction):
+        expected = list(
+            Task.objects.order_by(*SORT_ORDERINGS[(sort, direction)]).values_list(
+                "pk", flat=True
+            )
+        )
+        body = self.get_page(f"?sort={sort}&dir={direction}")
+        pages = [self.rows(body)]
+        while next_query := self.link(body, "after"):
+            self.assertIn(f"sort={sort}&dir={direction}", next_query)
+            body = self.get_page(next_query)
+            pages.append(self.rows(body))
+        self.assertEqual([pk for page in pages for pk in page], expected)
+        self.assertEqual(len(pages), 3)
+
+        # Walk back from the last page to the first.
+        for page in reversed(pages[:-1]):
+            body = self.get_page(self.link(body, "before"))
+            self.assertEqual(self.rows(body), page)
+        self.assertIsNone(self.link(body, "before"))
+
+    def test_pages_cover_every_task_once(self):
+        for sort, direction in [
+            ("created", "desc"),
+            ("due", "asc"),
+            ("due", "desc"),
+            ("priority", "asc"),
+        ]:
+            with self.subTest(sort=sort, direction=direction):
+                self.assert_pages_cover(sort, direction)
+
+    def test_tampered_cursor_returns_first_page(self):
+        first = self.rows(self.get_page())
+        body = self.get_page()
+        token = self.link(body, "after").rsplit("after=", 1)[1]
+
+        body = self.get_page(f"?after={token[:-2]}xx")
+        self.assertEqual(self.rows(body), first)
+
+    def test_cursor_from_another_sort_returns_first_page(self):
+        token = self.link(self.get_page(), "after").rsplit("after=", 1)[1]
+        first = self.rows(self.get_page("?sort=priority&dir=desc"))
+
+        body = self.get_page(f"?sort=priority&dir=desc&after={token}")
+        self.assertEqual(self.rows(body), first)
+
+    def test_unreadable_cursor_value_returns_first_page(self):
+        token = signing.dumps(
+            ["priority", True, "not-a-number", 1], salt=TASK_LIST_CURSOR_SALT
+        )
+        first = self.rows(self.get_page("?sort=priority&dir=desc"))
+
+        body = self.get_page(f"?sort=priority&dir=desc&before={token}")
+        self.assertEqual(self.rows(body), first)
+        self.assertIsNone(self.link(body, "before"))
@@ -1,17 +1,21 @@
-from typing import Dict, List
 from datetime import timedelta
+from itertools import groupby
+from operator import attrgetter
 
 from django import forms
 from django.db import models
+from django.db.models.functions import Coalesce, RowNumber, Substr
+from django.http import Http404
 from django.utils import timezone
 from django.shortcuts import get_object_or_404, redirect, render
 from django.views.decorators.http import require_POST
 from django.urls import reverse
-from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
+from django.core import signing
+from django.core.exceptions import ValidationError
 
 from core.views import HttpRequest
 from tasks.models import Task
-from tasks.models import Comment, Project, Tag
+from tasks.models import Comment, Project, StatusCounter, Tag
 
 BOARD_STATUSES = [
     (Task.Status.TODO, "To do"),
@@ -19,6 +23,39 @@ BOARD_STATUSES = [
     (Task.Status.BLOCKED, "Blocked"),
     (Task.Status.DONE, "Recently done"),
 ]
+BOARD_STATUS_CODES = tuple(code for code, _ in BOARD_STATUSES)
+BOARD_STATUS_CODE_SET = frozenset(BOARD_STATUS_CODES)
+BOARD_COLUMNS = tuple({"code": code, "label": label} for code, label in BOARD_STATUSES)
+BOARD_COLUMN_ORDERING = ("order", "-priority", "due_at", "-created_at")
+# Cards rendered per column; older ones stay reachable from the task list.
+# Created and moved tasks take the next `order` in their status, so keeping
+# the highest orders keeps the cards the user most recently touched.
+BOARD_COLUMN_LIMIT = 50
+BOARD_COLUMN_RECENCY = ("-order", "-id")
+
+TASK_SORT_FIELDS = {
+    "title": "title",
+    "project": "project__name",
+    "status": "status",
+    "priority": "priority",
+    "due": "due_at",
+    "updated": "updated_at",
+    "created": "created_at",
+}
+# (sort, dir) -> order_by() arguments. The pk tiebreaker gives every row a
+# unique position for keyset pagination, and nulls sort last either way so
+# the cursor comparisons behave the same on SQLite and Postgres.
+SORT_ORDERINGS = {
+    (sort, direction): (
+        models.OrderBy(models.F(field), descending=descending, nulls_last=True),
+        models.OrderBy(models.F("id"), descending=descending),
+    )
+    for sort, field in TASK_SORT_FIELDS.items()
+    for direction, descending in (("asc", False), ("desc", True))
+}
+DEFAULT_SORT_ORDERING = SORT_ORDERINGS[("created", "desc")]
+TASK_LIST_PAGE_SIZE = 25
+TASK_LIST_CURSOR_SALT = "tasks.task_list.cursor"
 
 
 def task_board(request: HttpRequest):
@@ -38,43 +75,25 @@ def task_board(request: HttpRequest):
 def task_list(request: HttpRequest):
     sort = request.GET.get("sort") or "created"
     direction = request.GET.get("dir") or "desc"
-    sort_map = {
-        "title": "title",
-        "project": "project__name",
-        "status": "status",
-        "priority": "priority",
-        "due": "due_at",
-        "updated": "updated_at",
-        "created": "created_at",
-    }
-    sort_field = sort_map.get(sort, "created_at")
-    if direction == "asc":
-        ordering = sort_field
-    else:
-        ordering = f"-{sort_field}"
+    ordering = SORT_ORDERINGS.get((sort, direction), DEFAULT_SORT_ORDERING)
 
     tasks_qs = (
         Task.objects.select_related("project", "parent")
-        .prefetch_related("tags")
-        .order_by(ordering)
+        .defer("description")
+        .annotate(description_preview=_description_preview(80))
     )
-    paginator = Paginator(tasks_qs, 25)
-    page = request.GET.get("page") or 1
-    try:
-        tasks_page = paginator.page(page)
-    except (PageNotAnInteger, EmptyPage):
-        tasks_page = paginator.page(1)
+    page = _keyset_page(
+        tasks_qs,
+        ordering,
+        after=request.GET.get("after"),
+        before=request.GET.get("before"),
+    )
+    models.prefetch_related_objects(page["tasks"], _prefetch_tag_chips())
 
     return render(
         request,
         "tasks/task_list.html",
-        {
-            "page_obj": tasks_page,
-            "paginator": paginator,
-            "tasks": tasks_page.object_list,
-            "sort": sort,
-            "direction": direction,
-        },
+        {**page, "sort": sort, "direction": direction},
     )
 
 
@@ -82,19 +101,14 @@ def board_fragment(request: HttpRequest):
     """
     Return just the board partial for HTMX refreshes.
     """
-    return render(
-        request,
-        "tasks/partials/board.html",
-        {**_fetch_board_context()},
-    )
+    return render(request, "tasks/partials/board.html", _fetch_board_context())
 
 
 @require_POST
 def move_task(request: HttpRequest):
     task_id = request.POST.get("task_id")
     status = request.POST.get("status")
-    valid_statuses = {code for code, _ in BOARD_STATUSES}
-    if not task_id or not status or status not in valid_statuses:
+    if not task_id or not status or status not in BOARD_STATUS_CODE_SET:
         return render(
             request,
             "tasks/partials/board.html",
@@ -102,25 +116,40 @@ def move_task(request: HttpRequest):
             status=400,
         )
 
-    task = get_object_or_404(Task, pk=task_id)
-    max_order = (
-        Task.objects.filter(status=status).aggregate(max_order=models.Max("order"))[
-            "max_order"
-        ]
-        or 0
+    # A single UPDATE instead of load-then-save; it mirrors Task.save()'s
+    # completed_at bookkeeping.
+    now = timezone.now()
+    updated = Task.objects.filter(pk=task_id).update(
+        status=status,
+        order=StatusCounter.next_order_for(status),
+        completed_at=(
+            Coalesce("completed_at", models.Value(now))
+            if status == Task.Status.DONE
+            else None
+        ),
+        updated_at=now,
     )
-    task.status = status
-    task.order = max_order + 1
-    update_fields = ["status", "order", "updated_at"]
-    if status == Task.Status.DONE and task.completed_at is None:
-        task.completed_at = timezone.now()
-        update_fields.append("completed_at")
-    task.save(update_fields=update_fields)
+    if not updated:
+        raise Http404("No Task matches the given query.")
 
+    # Only the source and target columns changed, so swap just those in
+    # out-of-band. Fall back to the whole board if the source is unknown.
+    from_status = request.POST.get("from_status")
+    if from_status not in BOARD_STATUS_CODE_SET:
+        return render(
+            request,
+            "tasks/partials/board.html",
+            {
+                **_fetch_board_context(),
+                "dropped_task_pk": int(task_id),
+                "swap_oob": True,
+            },
+        )
+    columns = [c for c in BOARD_COLUMNS if c["code"] in (from_status, status)]
     return render(
         request,
-        "tasks/partials/board.html",
-        {**_fetch_board_context(), "dropped_task_pk": task.pk},
+        "tasks/partials/board_columns_oob.html",
+        {"columns": _fetch_board_columns(columns), "dropped_task_pk": int(task_id)},
     )
 
 
@@ -129,13 +158,7 @@ def create_task(request: HttpRequest):
     form = TaskForm(request.POST)
     if form.is_valid():
         task = form.save(commit=False)
-        max_order = (
-            Task.objects.filter(status=task.status).aggregate(
-                max_order=models.Max("order")
-            )["max_order"]
-            or 0
-        )
-        task.order = max_order + 1
+        task.order = StatusCounter.next_order_for(task.status)
         task.save()
         form.save_m2m()
         context = {
@@ -168,28 +191,202 @@ def create_task(request: HttpRequest):
 
 # Helper functions
 def _fetch_board_context():
-    cutoff = timezone.now() - timedelta(days=14)
-    tasks = (
-        Task.objects.filter(status__in=[code for code, _ in BOARD_STATUSES])
-        .filter(
-            models.Q(status=Task.Status.DONE, completed_at__gte=cutoff)
-            | ~models.Q(status=Task.Status.DONE)
+    return {"columns": _fetch_board_columns(BOARD_COLUMNS)}
+
+
+def _fetch_board_columns(columns):
+    """
+    Fill the given column skeletons with their cards.
+    """
+    codes = {column["code"] for column in columns}
+    branches = []
+    # Active and recently done cards are fetched as separate branches of a
+    # UNION rather than one OR'd filter, so each can use its own index.
+    active_codes = codes - {Task.Status.DONE}
+    if active_codes:
+        branches.append(Task.objects.filter(status__in=active_codes))
+    if Task.Status.DONE in codes:
+        cutoff = timezone.now() - timedelta(days=14)
+        branches.append(
+            Task.objects.filter(status=Task.Status.DONE, completed_at__gte=cutoff)
         )
-        .select_related("parent", "project")
-        .prefetch_related("tags")
-        .order_by("order", "-priority", "due_at", "-created_at")
+    if not branches:
+        return [_fill_board_column(column, []) for column in columns]
+
+    first, *rest = [_board_column_queryset(branch) for branch in branches]
+    # Combined querysets can't prefetch, so the tag chips are attached to the
+    # evaluated list instead.
+    tasks = list(
+        first.union(*rest, all=True).order_by("status", *BOARD_COLUMN_ORDERING)
     )
-    grouped: Dict[Task.Status | str, List[Task]] = {
-        code: [] for code, _ in BOARD_STATUSES
+    models.prefetch_related_objects(tasks, _prefetch_tag_chips())
+    grouped = {
+        status: list(status_tasks)
+        for status, status_tasks in groupby(tasks, key=attrgetter("status"))
     }
-    for task in tasks:
-        grouped[task.status].append(task)
-
-    columns = [
-        {"code": code, "label": label, "tasks": grouped.get(code, [])}
-        for code, label in BOARD_STATUSES
+    return [
+        _fill_board_column(column, grouped.get(column["code"], []))
+        for column in columns
     ]
-    return {"columns": columns}
+
+
+def _fill_board_column(column, tasks):
+    total = tasks[0].column_total if tasks else 0
+    return {**column, "tasks": tasks, "total": total, "hidden": total - len(tasks)}
+
+
+def _board_column_queryset(queryset):
+    return (
+        queryset.select_related("project")
+        .only(
+            "title",
+            "status",
+            "priority",
+            "energy",
+            "due_at",
+            "estimate_minutes",
+            "order",
+            "completed_at",
+            "created_at",
+            "project__name",
+        )
+        .annotate(
+            description_preview=_description_preview(100),
+            column_rank=models.Window(
+                RowNumber(),
+                partition_by=[models.F("status")],
+                order_by=BOARD_COLUMN_RECENCY,
+            ),
+            column_total=models.Window(
+                models.Count("id"), partition_by=[models.F("status")]
+            ),
+        )
+        .filter(column_rank__lte=BOARD_COLUMN_LIMIT)
+        .order_by()
+    )
+
+
+def _keyset_page(queryset, ordering, after=None, before=None):
+    """
+    Fetch the page of `queryset` that follows the `after` cursor or precedes
+    the `before` cursor. Unlike Paginator this needs no COUNT(*) and no
+    OFFSET: the cursor is the (sort value, pk) of the row at the page edge.
+    A cursor made for another ordering, or one that can't be read, is ignored
+    and the first page is returned.
+    """
+    primary = ordering[0]
+    field = primary.expression.name
+    sort_key = [field, primary.descending]
+    backwards = False
+    cursor = _load_cursor(after, sort_key)
+    if cursor is None:
+        cursor = _load_cursor(before, sort_key)
+        backwards = cursor is not None
+
+    if cursor is not None:
+        lookup = "lt" if primary.descending != backwards else "gt"
+        try:
+            queryset = queryset.filter(
+                _cursor_filter(field, *cursor, lookup, nulls_follow=not backwards)
+            )
+        except (TypeError, ValueError, ValidationError):
+            cursor, backwards = None, False
+    if backwards:
+        ordering = [order.copy().reverse_ordering() for order in ordering]
+    queryset = queryset.order_by(*ordering)
+
+    # One extra row tells us whether another page exists in that direction.
+    tasks = list(queryset[: TASK_LIST_PAGE_SIZE + 1])
+    has_more = len(tasks) > TASK_LIST_PAGE_SIZE
+    tasks = tasks[:TASK_LIST_PAGE_SIZE]
+    if backwards:
+        tasks.reverse()
+        has_previous, has_next = has_more, True
+    else:
+        has_previous, has_next = cursor is not None, has_more
+
+    return {
+        "tasks": tasks,
+        "previous_cursor": (
+            _dump_cursor(tasks[0], sort_key) if tasks and has_previous else None
+        ),
+        "next_cursor": (
+            _dump_cursor(tasks[-1], sort_key) if tasks and has_next else None
+        ),
+    }
+
+
+def _cursor_filter(field, value, pk, lookup, nulls_follow):
+    # Rows strictly past (value, pk) in the direction given by `lookup`.
+    # Nulls sort after every value, so they are past a non-null cursor only
+    # when paging towards the end of the list.
+    if value is None:
+        q = models.Q(**{f"{field}__isnull": True, f"pk__{lookup}": pk})
+        if not nulls_follow:
+            q |= models.Q(**{f"{field}__isnull": False})
+        return q
+    q = models.Q(**{f"{field}__{lookup}": value}) | models.Q(
+        **{field: value, f"pk__{lookup}": pk}
+    )
+    if nulls_follow:
+        q |= models.Q(**{f"{field}__isnull": True})
+    return q
+
+
+def _dump_cursor(task, sort_key):
+    # The cursor records the ordering it was taken from, so it can't be
+    # replayed against a different sort.
+    field, _ = sort_key
+    value = task
+    for attr in field.split("__"):
+        value = getattr(value, attr)
+        if value is None:
+            break
+    if hasattr(value, "isoformat"):
+        value = value.isoformat()
+    return signing.dumps([*sort_key, value, task.pk], salt=TASK_LIST_CURSOR_SALT)
+
+
+def _load_cursor(token, sort_key):
+    if not token:
+        return None
+    try:
+        field, descending, value, pk = signing.loads(token, salt=TASK_LIST_CURSOR_SALT)
+    except (signing.BadSignature, TypeError, ValueError):
+        return None
+    if [field, descending] != sort_key or not isinstance(pk, int):
+        return None
+    return value, pk
+
+
+def _project_list_queryset():
+    return Project.objects.order_by("-is_active", "name").prefetch_related(
+        _prefetch_tag_chips()
+    )
+
+
+def _tag_list_queryset():
+    return Tag.objects.order_by("name")
+
+
+def _description_preview(length: int):
+    """
+    Leading slice of the description, one character longer than `length` so
+    `truncatechars:length` still knows whether to add an ellipsis.
+    """
+    return Substr("description", 1, length + 1)
+
+
+def _prefetch_tag_chips():
+    """
+    Prefetch tags into a plain `cached_tags` list with just the columns the tag
+    chips render.
+    """
+    return models.Prefetch(
+        "tags",
+        queryset=Tag.objects.only("id", "name", "color"),
+        to_attr="cached_tags",
+    )
 
 
 class TaskForm(forms.ModelForm):
@@ -212,17 +409,15 @@ class TaskForm(forms.ModelForm):
             "description": forms.Textarea(
                 attrs={"class": "form-control", "rows": 3, "placeholder": "Details"}
             ),
+            "status": forms.Select(attrs={"class": "form-select"}),
+            "priority": forms.Select(attrs={"class": "form-select"}),
+            "energy": forms.Select(attrs={"class": "form-select"}),
             "due_at": forms.DateInput(attrs={"type": "date", "class": "form-control"}),
             "estimate_minutes": forms.NumberInput(attrs={"class": "form-control"}),
+            "parent": forms.Select(attrs={"class": "form-select"}),
+            "tags": forms.SelectMultiple(attrs={"class": "form-select"}),
         }
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        for name in ["status", "priority", "energy", "parent", "tags"]:
-            widget = self.fields[name].widget
-            css = widget.attrs.get("class", "")
-            widget.attrs["class"] = f"{css} form-select".strip()
-
 
 class CommentForm(forms.ModelForm):
     class Meta:
@@ -307,17 +502,12 @@ class ProjectForm(forms.ModelForm):
                     "placeholder": "What is this project about?",
                 }
             ),
+            "tags": forms.SelectMultiple(attrs={"class": "form-select"}),
         }
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        widget = self.fields["tags"].widget
-        css = widget.attrs.get("class", "")
-        widget.attrs["class"] = f"{css} form-select".strip()
-
 
 def project_list(request: HttpRequest):
-    projects = Project.objects.order_by("-is_active", "name").prefetch_related("tags")
+    projects = _project_list_queryset()
     form = ProjectForm()
     if not request.htmx:
         return redirect(f"{reverse('task_board')}?show_projects=1")
@@ -329,7 +519,6 @@ def project_list(request: HttpRequest):
 
 
 def create_project(request: HttpRequest):
-    projects = Project.objects.order_by("-is_active", "name").prefetch_related("tags")
     if request.method == "GET":
         if not request.htmx:
             return redirect(f"{reverse('task_board')}?show_projects=1")
@@ -344,11 +533,14 @@ def create_project(request: HttpRequest):
         form.save()
         if not request.htmx:
             return redirect(f"{reverse('task_board')}?show_projects=1")
-        projects = Project.objects.order_by("-is_active", "name").prefetch_related("tags")
         return render(
             request,
             "tasks/partials/project_offcanvas_list.html",
-            {"projects": projects, "form": ProjectForm(), "saved": True},
+            {
+                "projects": _project_list_queryset(),
+                "form": ProjectForm(),
+                "saved": True,
+            },
             status=201,
         )
 
@@ -367,7 +559,17 @@ def project_detail(request: HttpRequest, project_id: int):
         Project.objects.prefetch_related("tags").prefetch_related(
             models.Prefetch(
                 "tasks",
-                queryset=Task.objects.select_related("project").prefetch_related("tags"),
+                queryset=Task.objects.only(
+                    "title",
+                    "status",
+                    "priority",
+                    "energy",
+                    "due_at",
+                    "created_at",
+                    "project_id",
+                )
+                .annotate(description_preview=_description_preview(120))
+                .prefetch_related(_prefetch_tag_chips()),
             )
         ),
         pk=project_id,
@@ -426,7 +628,7 @@ class TagForm(forms.ModelForm):
 
 
 def tag_list(request: HttpRequest):
-    tags = Tag.objects.annotate(task_count=models.Count("tasks")).order_by("name")
+    tags = _tag_list_queryset()
     form = TagForm()
     if not request.htmx:
         return redirect(f"{reverse('task_board')}?show_tags=1")
@@ -438,7 +640,6 @@ def tag_list(request: HttpRequest):
 
 
 def create_tag(request: HttpRequest):
-    tags = Tag.objects.annotate(task_count=models.Count("tasks")).order_by("name")
     if request.method == "GET":
         if not request.htmx:
             return redirect(f"{reverse('task_board')}?show_tags=1")
@@ -453,11 +654,10 @@ def create_tag(request: HttpRequest):
         form.save()
         if not request.htmx:
             return redirect(f"{reverse('task_board')}?show_tags=1")
-        tags = Tag.objects.annotate(task_count=models.Count("tasks")).order_by("name")
         return render(
             request,
             "tasks/partials/tag_offcanvas_list.html",
-            {"tags": tags, "form": TagForm(), "saved": True},
+            {"tags": _tag_list_queryset(), "form": TagForm(), "saved": True},
             status=201,
         )
 
@@ -472,14 +672,10 @@ def create_tag(request: HttpRequest):
 
 
 def tag_detail(request: HttpRequest, tag_id: int):
-    tag = get_object_or_404(
-        Tag.objects.annotate(task_count=models.Count("tasks")),
-        pk=tag_id,
-    )
+    tag = get_object_or_404(Tag, pk=tag_id)
     tasks_qs = (
         Task.objects.filter(tags=tag)
         .select_related("project")
-        .prefetch_related("tags")
         .order_by("status", "-priority", "due_at", "-created_at")
     )
     board_context = _fetch_board_context() if request.htmx else None